@@ -4,125 +4,309 @@ SEO Sitemap CLI Tool
 Tool for working with sitemap.xml, IndexNow submission and SEO analysis
 """
 
+import asyncio
 import csv
+import json
+import os
 import re
+import sys
+import threading
 import time
 import xml.etree.ElementTree as ET
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 import click
+import httpx
 import requests
-
-
-@dataclass
+from lxml import etree as LET
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _load_json(data: bytes):
+    """Deserialize JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Shared on-disk cache location for HTTP responses
+CACHE_DIR = os.path.expanduser("~/.cache/indexnow-cli")
+
+# Precompiled patterns for SEO content analysis (compiled once at import time
+# instead of going through re's pattern cache on every URL)
+#
+# All head-region fields are matched by a single alternation so one finditer
+# pass over the markup fills every field instead of one scan per pattern.
+# Patterns operate on raw bytes so response bodies never need a full Unicode
+# decode; only the small captured groups are decoded.
+_HEAD_RE = re.compile(
+    rb"<title[^>]*>(?P<title>.*?)</title>"
+    rb'|<meta[^>]*name=["\']description["\'][^>]*content=["\'](?P<desc>[^"\']*)["\']'
+    rb'|<meta[^>]*name=["\']robots["\'][^>]*content=["\'](?P<robots>[^"\']*)["\']'
+    rb'|<meta[^>]*property=["\']og:title["\'][^>]*content=["\'](?P<og_title>[^"\']*)["\']'
+    rb'|<meta[^>]*property=["\']og:description["\'][^>]*content=["\'](?P<og_desc>[^"\']*)["\']'
+    rb'|<link[^>]*rel=["\']canonical["\'][^>]*href=["\'](?P<canonical>[^"\']*)["\']',
+    re.IGNORECASE | re.DOTALL,
+)
+_H1_RE = re.compile(rb"<h1[^>]*>(.*?)</h1>", re.IGNORECASE | re.DOTALL)
+
+# Structured-data markers are plain literals, so they are matched with
+# C-level substring scans over a once-lowercased buffer instead of a
+# backtracking regex alternation
+_SCHEMA_MARKERS = (b"application/ld+json", b"microdata", b"@type")
+
+
+def _has_schema_markers(html: bytes) -> bool:
+    """Scan for structured-data markers, case-folding the document once"""
+    lowered = html.lower()
+    return any(marker in lowered for marker in _SCHEMA_MARKERS)
+
+
+def _strip_tags(s: str) -> str:
+    """Strip inner HTML tags with plain find/slice calls instead of a regex"""
+    if "<" not in s:
+        return s.strip()
+
+    parts = []
+    pos = 0
+    while True:
+        lt = s.find("<", pos)
+        if lt < 0:
+            parts.append(s[pos:])
+            break
+        parts.append(s[pos:lt])
+        gt = s.find(">", lt + 1)
+        if gt < 0:
+            break
+        pos = gt + 1
+    return "".join(parts).strip()
+
+
+# Maps _HEAD_RE group names to URLAnalysis attributes
+_HEAD_FIELDS = {
+    "title": "title",
+    "desc": "meta_description",
+    "robots": "robots_meta",
+    "og_title": "og_title",
+    "og_desc": "og_description",
+    "canonical": "canonical_url",
+}
+
+
+@dataclass(slots=True)
 class URLAnalysis:
     url: str
     status_code: int
     response_time: float
     title: Optional[str] = None
     meta_description: Optional[str] = None
-    h1_tags: List[str] = None
+    h1_tags: List[str] = field(default_factory=list)
     canonical_url: Optional[str] = None
     robots_meta: Optional[str] = None
     og_title: Optional[str] = None
     og_description: Optional[str] = None
     has_schema_markup: bool = False
-    errors: List[str] = None
-    warnings: List[str] = None
-
-    def __post_init__(self):
-        if self.h1_tags is None:
-            self.h1_tags = []
-        if self.errors is None:
-            self.errors = []
-        if self.warnings is None:
-            self.warnings = []
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
 
 
 class SitemapParser:
     """Parser for sitemap.xml files"""
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, use_cache: bool = True, dedup: str = "exact"):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "SEO-Sitemap-Tool/1.0"})
+        self.dedup = dedup
+        if use_cache and requests_cache is not None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            self.session = requests_cache.CachedSession(
+                os.path.join(CACHE_DIR, "http_cache"), backend="sqlite", expire_after=3600
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(
+            {"User-Agent": "SEO-Sitemap-Tool/1.0", "Accept-Encoding": "gzip, deflate, br"}
+        )
+        # Memoizes parsed URL lists so repeat parses within one run are free
+        self._parse_cache = {}
 
     def parse_sitemap(self, sitemap_url: str) -> List[str]:
-        """Parse sitemap.xml and return list of URLs"""
+        """Parse sitemap.xml and return list of unique URLs"""
+        if sitemap_url in self._parse_cache:
+            click.echo(f"[CACHE] Reusing parsed sitemap: {sitemap_url}")
+            return self._parse_cache[sitemap_url]
+
+        dup_counts = Counter()
+        unique_urls = list(self._iter_into(sitemap_url, self._make_seen(), dup_counts))
+
+        duplicates_total = sum(dup_counts.values())
+        click.echo(f"[PARSED] Found {len(unique_urls) + duplicates_total} total URLs, {len(unique_urls)} unique")
+
+        if duplicates_total > 0:
+            click.echo(f"[DUPLICATES] Found {duplicates_total} duplicate URLs")
+            click.echo("[DUPLICATE LIST]")
+            for duplicate_url, extra_count in dup_counts.items():
+                click.echo(f"  {extra_count + 1}x: {duplicate_url}")
+
+        self._parse_cache[sitemap_url] = unique_urls
+        return unique_urls
+
+    def iter_sitemap_urls(self, sitemap_url: str):
+        """Yield unique URLs as they are discovered, streaming nested sitemaps"""
+        yield from self._iter_into(sitemap_url, self._make_seen(), Counter())
+
+    def _make_seen(self):
+        """Build the have-I-seen-this structure used for URL deduplication
+
+        Bloom dedup trades a tiny false-positive rate for an
+        order-of-magnitude smaller footprint on 10M+ URL sitemap indexes;
+        both structures share the `url in seen` / `seen.add(url)` interface.
+        """
+        if self.dedup == "bloom":
+            if ScalableBloomFilter is None:
+                click.echo("[DEDUP] pybloom-live not installed, falling back to exact dedup", err=True)
+            else:
+                return ScalableBloomFilter(initial_capacity=1_000_000, error_rate=1e-6)
+        return set()
+
+    # Concurrent fetches for one level of a sitemap index
+    NESTED_FETCH_WORKERS = 8
+
+    def _iter_into(self, sitemap_url: str, seen: set, dup_counts: Counter):
+        """Walk sitemap documents breadth-first, yielding unseen URLs
+
+        Each level of the index is fetched concurrently: a typical index
+        references tens of nested sitemaps, and fetching them serially
+        stacks up one network round trip per document.
+        """
+        visited = {sitemap_url}
+        level = [sitemap_url]
+        is_root = True
+
+        while level:
+            next_level = []
+
+            with ThreadPoolExecutor(max_workers=min(self.NESTED_FETCH_WORKERS, len(level))) as executor:
+                futures = [(doc_url, executor.submit(self._fetch_locs, doc_url)) for doc_url in level]
+
+                for doc_url, future in futures:
+                    try:
+                        urls, sitemap_urls = future.result()
+                    except Exception as e:
+                        if is_root:
+                            raise
+                        click.echo(f"Error processing nested sitemap {doc_url}: {e}", err=True)
+                        continue
+
+                    for url in urls:
+                        if url in seen:
+                            dup_counts[url] += 1
+                        else:
+                            seen.add(url)
+                            yield url
+
+                    if sitemap_urls:
+                        click.echo(f"[SITEMAP INDEX] Found {len(sitemap_urls)} nested sitemaps")
+                        for idx, nested_url in enumerate(sitemap_urls, 1):
+                            click.echo(f"[NESTED {idx}] {nested_url}")
+
+                    # Guard against index cycles with the visited set
+                    for nested_url in sitemap_urls:
+                        if nested_url not in visited:
+                            visited.add(nested_url)
+                            next_level.append(nested_url)
+
+            is_root = False
+            level = next_level
+
+    def _fetch_locs(self, sitemap_url: str):
+        """Fetch and stream-parse one sitemap document"""
         try:
             click.echo(f"[REQUEST] Fetching sitemap: {sitemap_url}")
 
             # Handle local file URLs
             if sitemap_url.startswith("file://"):
                 file_path = sitemap_url.replace("file://", "")
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                click.echo(f"[FILE] Loaded local file: {file_path}")
-            else:
-                click.echo(f"[CURL] curl -H 'User-Agent: SEO-Sitemap-Tool/1.0' '{sitemap_url}'")
-                response = self.session.get(sitemap_url, timeout=self.timeout)
+                click.echo(f"[FILE] Streaming local file: {file_path}")
+                with open(file_path, "rb") as source:
+                    return self._collect_locs(source)
+
+            click.echo(f"[CURL] curl -H 'User-Agent: SEO-Sitemap-Tool/1.0' '{sitemap_url}'")
+            with self.session.get(sitemap_url, stream=True, timeout=self.timeout) as response:
                 response.raise_for_status()
-                content = response.content
-                click.echo(f"[RESPONSE] Status: {response.status_code}, Size: {len(content)} bytes")
-
-            root = ET.fromstring(content)
-            urls = []
-
-            # Handle regular sitemap
-            for url_elem in root.findall(".//{http://www.sitemaps.org/schemas/sitemap/0.9}loc"):
-                if url_elem.text:
-                    urls.append(url_elem.text.strip())
-
-            # Handle sitemap index
-            sitemap_urls = []
-            for sitemap_elem in root.findall(".//{http://www.sitemaps.org/schemas/sitemap/0.9}sitemap"):
-                loc_elem = sitemap_elem.find("{http://www.sitemaps.org/schemas/sitemap/0.9}loc")
-                if loc_elem is not None and loc_elem.text:
-                    sitemap_urls.append(loc_elem.text.strip())
-
-            if sitemap_urls:
-                click.echo(f"[SITEMAP INDEX] Found {len(sitemap_urls)} nested sitemaps")
-                for idx, nested_url in enumerate(sitemap_urls, 1):
-                    click.echo(f"[NESTED {idx}] {nested_url}")
-
-            # Recursively process nested sitemaps
-            for sitemap_url in sitemap_urls:
-                try:
-                    nested_urls = self.parse_sitemap(sitemap_url)
-                    urls.extend(nested_urls)
-                except Exception as e:
-                    click.echo(f"Error processing nested sitemap {sitemap_url}: {e}", err=True)
-
-            # Check for duplicates
-            unique_urls = list(set(urls))
-            duplicates_count = len(urls) - len(unique_urls)
-
-            click.echo(f"[PARSED] Found {len(urls)} total URLs, {len(unique_urls)} unique")
-
-            if duplicates_count > 0:
-                click.echo(f"[DUPLICATES] Found {duplicates_count} duplicate URLs")
-                # Find and display duplicates
-                from collections import Counter
-
-                url_counts = Counter(urls)
-                duplicates = [url for url, count in url_counts.items() if count > 1]
-
-                click.echo("[DUPLICATE LIST]")
-                for duplicate_url in duplicates:
-                    count = url_counts[duplicate_url]
-                    click.echo(f"  {count}x: {duplicate_url}")
-
-            return unique_urls
+                # Let urllib3 decompress gzip/deflate transparently while we stream
+                response.raw.decode_content = True
+                click.echo(f"[RESPONSE] Status: {response.status_code}, streaming body")
+                return self._collect_locs(response.raw)
 
         except (requests.RequestException, FileNotFoundError, IOError) as e:
             raise click.ClickException(f"Error loading sitemap: {e}")
-        except ET.ParseError as e:
+        except (ET.ParseError, LET.XMLSyntaxError) as e:
             raise click.ClickException(f"Error parsing XML: {e}")
 
+    def _collect_locs(self, source):
+        """Collect page URLs and nested sitemap references from a streamed document"""
+        urls = []
+        sitemap_urls = []
+        for loc, is_nested in self._iter_locs(source):
+            if is_nested:
+                sitemap_urls.append(loc)
+            else:
+                urls.append(loc)
+        return urls, sitemap_urls
+
+    _SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+    @classmethod
+    def _iter_locs(cls, source):
+        """Stream (loc, is_nested_sitemap) pairs from an XML source without building the full tree"""
+        entry_tags = (cls._SITEMAP_NS + "url", cls._SITEMAP_NS + "sitemap", "url", "sitemap")
+
+        for _, elem in LET.iterparse(source, events=("end",), tag=entry_tags):
+            is_nested = elem.tag.rsplit("}", 1)[-1] == "sitemap"
+            for child in elem:
+                if child.tag.rsplit("}", 1)[-1] == "loc" and child.text:
+                    yield child.text.strip(), is_nested
+                    break
+
+            # Drop the processed entry and any already-consumed siblings so
+            # peak memory stays O(1) per element
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
 
 class IndexNowSubmitter:
     """Class for submitting URLs to IndexNow"""
@@ -130,13 +314,73 @@ class IndexNowSubmitter:
     # Static endpoints for major search engines
     STATIC_ENDPOINTS = {"bing": "https://api.indexnow.org/indexnow", "yandex": "https://yandex.com/indexnow"}
 
-    def __init__(self, api_key: str, key_location: str, timeout: int = 30):
+    # The registry changes rarely; cache the processed engine list for a day
+    ENGINES_CACHE_TTL = 86400
+
+    def __init__(
+        self, api_key: str, key_location: str, timeout: int = 30, min_interval: float = 0.0, use_cache: bool = True
+    ):
         self.api_key = api_key
         self.key_location = key_location
         self.timeout = timeout
-        self.session = requests.Session()
+        self.min_interval = min_interval
+        # Registry metadata and submissions hit a handful of hosts repeatedly;
+        # HTTP/2 keep-alive multiplexes them over a few TLS connections
+        self.session = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
         self.available_engines = {}
-        self._load_search_engines()
+        self._throttle_lock = threading.Lock()
+        self._next_allowed = 0.0
+        # Key and key location never change per instance; only host and
+        # urlList vary between submissions
+        self._payload_base = {"key": api_key, "keyLocation": key_location}
+        self._post_headers = {"Content-Type": "application/json; charset=utf-8"}
+        self._engines_cache_path = os.path.join(CACHE_DIR, "engines.json")
+
+        if not (use_cache and self._load_cached_engines()):
+            self._load_search_engines()
+            if use_cache:
+                self._save_engines_cache()
+
+    def _load_cached_engines(self) -> bool:
+        """Load the processed engine registry from disk if it is still fresh"""
+        try:
+            if time.time() - os.path.getmtime(self._engines_cache_path) < self.ENGINES_CACHE_TTL:
+                with open(self._engines_cache_path, "rb") as f:
+                    self.available_engines = _load_json(f.read())
+                click.echo(f"[REGISTRY] Loaded {len(self.available_engines)} engines from cache")
+                return True
+        except (OSError, ValueError):
+            pass
+        return False
+
+    def _save_engines_cache(self):
+        """Persist the processed engine registry for warm starts"""
+        if not self.available_engines:
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self._engines_cache_path, "wb") as f:
+                f.write(_dump_json(self.available_engines))
+        except OSError:
+            pass
+
+    def _throttle(self):
+        """Space submissions at least min_interval apart across worker threads"""
+        if self.min_interval <= 0:
+            return
+
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.min_interval
+
+        if wait > 0:
+            time.sleep(wait)
 
     def _load_search_engines(self):
         """Load available search engines from IndexNow registry"""
@@ -145,31 +389,39 @@ class IndexNowSubmitter:
             response = self.session.get("https://www.indexnow.org/searchengines.json", timeout=self.timeout)
             response.raise_for_status()
 
-            engines_registry = response.json()
+            engines_registry = _load_json(response.content)
             click.echo(f"[REGISTRY] Found {len(engines_registry)} registered search engines")
 
-            # Load metadata for each engine
-            for engine_id, meta_url in engines_registry.items():
-                try:
-                    meta_response = self.session.get(meta_url, timeout=self.timeout)
-                    if meta_response.status_code == 200:
-                        meta_data = meta_response.json()
-                        if "api" in meta_data and not meta_data.get("unsubscribe", False):
-                            self.available_engines[engine_id] = {
-                                "name": meta_data.get("name", engine_id),
-                                "api": meta_data["api"],
-                                "host": meta_data.get("host", ""),
-                                "homepage": meta_data.get("homepage", ""),
-                            }
-                            click.echo(f"[ENGINE] Loaded: {engine_id} - {meta_data.get('name', 'Unknown')}")
+            # Load metadata for all engines concurrently; the registry lists
+            # ~15 independent hosts, so sequential fetches cost one RTT each
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                future_map = {
+                    executor.submit(self.session.get, meta_url, timeout=self.timeout): engine_id
+                    for engine_id, meta_url in engines_registry.items()
+                }
+
+                for future in as_completed(future_map):
+                    engine_id = future_map[future]
+                    try:
+                        meta_response = future.result()
+                        if meta_response.status_code == 200:
+                            meta_data = _load_json(meta_response.content)
+                            if "api" in meta_data and not meta_data.get("unsubscribe", False):
+                                self.available_engines[engine_id] = {
+                                    "name": meta_data.get("name", engine_id),
+                                    "api": meta_data["api"],
+                                    "host": meta_data.get("host", ""),
+                                    "homepage": meta_data.get("homepage", ""),
+                                }
+                                click.echo(f"[ENGINE] Loaded: {engine_id} - {meta_data.get('name', 'Unknown')}")
+                            else:
+                                click.echo(f"[ENGINE] Skipped: {engine_id} (unsubscribed or no API)")
                         else:
-                            click.echo(f"[ENGINE] Skipped: {engine_id} (unsubscribed or no API)")
-                    else:
-                        click.echo(
-                            f"[ENGINE] Failed to load metadata for {engine_id}: HTTP {meta_response.status_code}"
-                        )
-                except Exception as e:
-                    click.echo(f"[ENGINE] Error loading {engine_id}: {e}")
+                            click.echo(
+                                f"[ENGINE] Failed to load metadata for {engine_id}: HTTP {meta_response.status_code}"
+                            )
+                    except Exception as e:
+                        click.echo(f"[ENGINE] Error loading {engine_id}: {e}")
 
         except Exception as e:
             click.echo(f"[REGISTRY] Failed to load search engines registry: {e}")
@@ -206,23 +458,23 @@ class IndexNowSubmitter:
                 available = list(self.get_available_engines().keys())
                 raise ValueError(f"Unsupported endpoint: {endpoint}. Available: {', '.join(available)}")
 
-        payload = {"host": host, "key": self.api_key, "keyLocation": self.key_location, "urlList": urls}
+        payload = {"host": host, **self._payload_base, "urlList": urls}
+        body = _dump_json(payload)
 
         # Log the curl command equivalent
-        import json as json_lib
-
         click.echo(f"[INDEXNOW] Submitting to {engine_name} ({endpoint})")
         click.echo(f"[ENDPOINT] {endpoint_url}")
         click.echo(f"[CURL] curl -X POST '{endpoint_url}' \\")
         click.echo("  -H 'Content-Type: application/json; charset=utf-8' \\")
-        click.echo(f"  -d '{json_lib.dumps(payload)}'")
+        click.echo(f"  -d '{body.decode('utf-8')}'")
 
         try:
+            self._throttle()
             response = self.session.post(
                 endpoint_url,
-                json=payload,
+                content=body,
                 timeout=self.timeout,
-                headers={"Content-Type": "application/json; charset=utf-8"},
+                headers=self._post_headers,
             )
 
             click.echo(f"[RESPONSE] Status: {response.status_code}")
@@ -251,7 +503,7 @@ class IndexNowSubmitter:
                 "endpoint_url": endpoint_url,
             }
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             click.echo(f"[ERROR] Request failed: {e}")
             return {
                 "status_code": 0,
@@ -265,39 +517,138 @@ class IndexNowSubmitter:
 class SEOAnalyzer:
     """SEO analyzer for URLs"""
 
-    def __init__(self, timeout: int = 30, max_workers: int = 10):
+    # SEO tags live near the top of the document; 256 KiB is enough for
+    # the <head> plus leading body content on typical pages
+    DEFAULT_MAX_HTML_BYTES = 262144
+
+    def __init__(self, timeout: int = 30, max_workers: int = 10, max_html_bytes: int = DEFAULT_MAX_HTML_BYTES):
         self.timeout = timeout
         self.max_workers = max_workers
+        self.max_html_bytes = max_html_bytes
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"})
+        self.session.headers.update(
+            {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept-Encoding": "gzip, deflate, br",
+            }
+        )
+
+        # Size the connection pool to the worker count so keep-alive sockets
+        # are reused instead of discarded under concurrent load
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def analyze_url(self, url: str) -> URLAnalysis:
         """Analyze single URL"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
-            response_time = time.time() - start_time
+            with self.session.get(url, timeout=self.timeout, stream=True, allow_redirects=True) as response:
+                html = self._read_capped(response) if response.status_code == 200 else None
+                response_time = (time.perf_counter_ns() - start_ns) / 1e9
 
-            analysis = URLAnalysis(url=url, status_code=response.status_code, response_time=response_time)
+                analysis = URLAnalysis(url=url, status_code=response.status_code, response_time=response_time)
 
-            if response.status_code == 200:
-                self._analyze_content(response.text, analysis)
-            else:
-                analysis.errors.append(f"HTTP {response.status_code}")
+                if html is not None:
+                    self._analyze_content(html, analysis, response.encoding or "utf-8")
+                else:
+                    analysis.errors.append(f"HTTP {response.status_code}")
 
-            return analysis
+                return analysis
 
         except requests.RequestException as e:
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
             return URLAnalysis(url=url, status_code=0, response_time=response_time, errors=[f"Request error: {str(e)}"])
 
-    def _analyze_content(self, html: str, analysis: URLAnalysis):
-        """Analyze HTML content"""
-        # Title
-        title_match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
-        if title_match:
-            analysis.title = title_match.group(1).strip()
+    def _read_capped(self, response) -> bytes:
+        """Stream the body in chunks, stopping at the document end or the size cap
+
+        Early exit happens on </html> rather than </head> because H1 and
+        schema extraction still need the body.
+        """
+        buf = bytearray()
+        for chunk in response.iter_content(8192, decode_unicode=False):
+            buf.extend(chunk)
+            if len(buf) >= self.max_html_bytes or b"</html>" in chunk:
+                break
+        return bytes(buf)
+
+    def _analyze_content(self, html: bytes, analysis: URLAnalysis, encoding: str = "utf-8"):
+        """Analyze raw HTML content"""
+        if HTMLParser is not None:
+            try:
+                self._extract_with_parser(html, analysis)
+            except Exception:
+                self._extract_with_regex(html, analysis, encoding)
+        else:
+            self._extract_with_regex(html, analysis, encoding)
+
+        self._check_extracted_fields(analysis)
+
+    def _extract_with_parser(self, html: bytes, analysis: URLAnalysis):
+        """Extract SEO fields in a single DOM parse (selectolax/Modest)"""
+        tree = HTMLParser(html)
+
+        title_node = tree.css_first("title")
+        if title_node is not None:
+            analysis.title = title_node.text().strip()
+
+        desc_node = tree.css_first('meta[name="description"]')
+        if desc_node is not None:
+            analysis.meta_description = (desc_node.attributes.get("content") or "").strip()
+
+        analysis.h1_tags = [node.text().strip() for node in tree.css("h1")]
+
+        canonical_node = tree.css_first('link[rel="canonical"]')
+        if canonical_node is not None:
+            analysis.canonical_url = (canonical_node.attributes.get("href") or "").strip()
+
+        robots_node = tree.css_first('meta[name="robots"]')
+        if robots_node is not None:
+            analysis.robots_meta = (robots_node.attributes.get("content") or "").strip()
+
+        og_title_node = tree.css_first('meta[property="og:title"]')
+        if og_title_node is not None:
+            analysis.og_title = (og_title_node.attributes.get("content") or "").strip()
+
+        og_desc_node = tree.css_first('meta[property="og:description"]')
+        if og_desc_node is not None:
+            analysis.og_description = (og_desc_node.attributes.get("content") or "").strip()
+
+        analysis.has_schema_markup = (
+            tree.css_first('script[type="application/ld+json"]') is not None
+            or tree.css_first("[itemtype]") is not None
+            or _has_schema_markers(html)
+        )
+
+    def _extract_with_regex(self, html: bytes, analysis: URLAnalysis, encoding: str = "utf-8"):
+        """Extract SEO fields with regexes (fallback when selectolax is unavailable)"""
+        # Head-region fields: one linear scan over the markup up to </head>.
+        # The find is bounded so a missing close tag cannot force a scan of
+        # the entire document.
+        head_end = html.find(b"</head>", 0, 200_000)
+        head = html if head_end < 0 else html[: head_end + len(b"</head>")]
+
+        for match in _HEAD_RE.finditer(head):
+            attr = _HEAD_FIELDS[match.lastgroup]
+            if getattr(analysis, attr) is None:
+                setattr(analysis, attr, match.group(match.lastgroup).decode(encoding, "replace").strip())
+
+        # H1 tags and schema markers live in the body, so scan the full document
+        h1_matches = _H1_RE.findall(html)
+        analysis.h1_tags = [_strip_tags(h1.decode(encoding, "replace")) for h1 in h1_matches]
+
+        analysis.has_schema_markup = _has_schema_markers(html)
+
+    @staticmethod
+    def _check_extracted_fields(analysis: URLAnalysis):
+        """Apply length checks and error/warning rules to extracted fields"""
+        if analysis.title is not None:
             if len(analysis.title) > 60:
                 analysis.warnings.append("Title too long (>60 characters)")
             elif len(analysis.title) < 30:
@@ -305,12 +656,7 @@ class SEOAnalyzer:
         else:
             analysis.errors.append("Missing title")
 
-        # Meta description
-        desc_match = re.search(
-            r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']*)["\']', html, re.IGNORECASE
-        )
-        if desc_match:
-            analysis.meta_description = desc_match.group(1).strip()
+        if analysis.meta_description is not None:
             if len(analysis.meta_description) > 160:
                 analysis.warnings.append("Meta description too long (>160 characters)")
             elif len(analysis.meta_description) < 120:
@@ -318,46 +664,11 @@ class SEOAnalyzer:
         else:
             analysis.errors.append("Missing meta description")
 
-        # H1 tags
-        h1_matches = re.findall(r"<h1[^>]*>(.*?)</h1>", html, re.IGNORECASE | re.DOTALL)
-        analysis.h1_tags = [re.sub(r"<[^>]+>", "", h1).strip() for h1 in h1_matches]
-
         if len(analysis.h1_tags) == 0:
             analysis.errors.append("Missing H1")
         elif len(analysis.h1_tags) > 1:
             analysis.warnings.append("Multiple H1 tags")
 
-        # Canonical URL
-        canonical_match = re.search(
-            r'<link[^>]*rel=["\']canonical["\'][^>]*href=["\']([^"\']*)["\']', html, re.IGNORECASE
-        )
-        if canonical_match:
-            analysis.canonical_url = canonical_match.group(1).strip()
-
-        # Robots meta
-        robots_match = re.search(
-            r'<meta[^>]*name=["\']robots["\'][^>]*content=["\']([^"\']*)["\']', html, re.IGNORECASE
-        )
-        if robots_match:
-            analysis.robots_meta = robots_match.group(1).strip()
-
-        # Open Graph
-        og_title_match = re.search(
-            r'<meta[^>]*property=["\']og:title["\'][^>]*content=["\']([^"\']*)["\']', html, re.IGNORECASE
-        )
-        if og_title_match:
-            analysis.og_title = og_title_match.group(1).strip()
-
-        og_desc_match = re.search(
-            r'<meta[^>]*property=["\']og:description["\'][^>]*content=["\']([^"\']*)["\']', html, re.IGNORECASE
-        )
-        if og_desc_match:
-            analysis.og_description = og_desc_match.group(1).strip()
-
-        # Schema markup
-        analysis.has_schema_markup = bool(re.search(r"application/ld\+json|microdata|@type", html, re.IGNORECASE))
-
-        # Additional checks
         if not analysis.og_title:
             analysis.warnings.append("Missing og:title")
         if not analysis.og_description:
@@ -365,97 +676,183 @@ class SEOAnalyzer:
         if not analysis.has_schema_markup:
             analysis.warnings.append("Missing structured markup")
 
-    def analyze_urls_batch(self, urls: List[str]) -> List[URLAnalysis]:
-        """Analyze list of URLs in multi-threaded mode"""
+    def analyze_urls_batch(self, urls) -> List[URLAnalysis]:
+        """Analyze URLs concurrently; accepts a list or a lazy URL iterable"""
+        return asyncio.run(self._analyze_urls_async(urls))
+
+    async def _analyze_urls_async(self, urls) -> List[URLAnalysis]:
+        """Fan out URL analysis over one HTTP/2 client with bounded concurrency"""
+        semaphore = asyncio.Semaphore(self.max_workers)
+        limits = httpx.Limits(max_connections=self.max_workers, max_keepalive_connections=self.max_workers)
         results = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_url = {executor.submit(self.analyze_url, url): url for url in urls}
+        # Cloning the requests session headers would drag connection-specific
+        # fields (Connection: keep-alive) into HTTP/2, which forbids them
+        headers = {
+            "User-Agent": self.session.headers["User-Agent"],
+            "Accept-Encoding": self.session.headers["Accept-Encoding"],
+        }
 
-            with click.progressbar(length=len(urls), label="Analyzing URLs") as bar:
-                for future in as_completed(future_to_url):
-                    result = future.result()
-                    results.append(result)
-                    bar.update(1)
+        async with httpx.AsyncClient(
+            http2=True, headers=headers, limits=limits, follow_redirects=True
+        ) as client:
+            if hasattr(urls, "__len__"):
+                tasks = [self._analyze_url_async(client, semaphore, url) for url in urls]
+
+                with click.progressbar(length=len(urls), label="Analyzing URLs") as bar:
+                    for task in asyncio.as_completed(tasks):
+                        results.append(await task)
+                        bar.update(1)
+            else:
+                await self._analyze_pipelined(client, semaphore, urls, results)
 
         return results
 
+    async def _analyze_pipelined(self, client, semaphore, urls, results: List[URLAnalysis]):
+        """Consume a lazy URL iterable, overlapping sitemap parsing with analysis
+
+        The iterator (typically SitemapParser.iter_sitemap_urls) performs
+        blocking HTTP fetches, so it is advanced in a worker thread while a
+        bounded task window keeps memory flat.
+        """
+        loop = asyncio.get_running_loop()
+        url_iter = iter(urls)
+        high_water = self.max_workers * 2
+        pending = set()
+        exhausted = False
+
+        while True:
+            while not exhausted and len(pending) < high_water:
+                url = await loop.run_in_executor(None, next, url_iter, None)
+                if url is None:
+                    exhausted = True
+                else:
+                    pending.add(asyncio.ensure_future(self._analyze_url_async(client, semaphore, url)))
+
+            if not pending:
+                break
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                results.append(task.result())
+            # Carriage-return updates only make sense on a terminal; piped
+            # output would get one unbounded run-on line
+            if sys.stdout.isatty():
+                click.echo(f"\rAnalyzing URLs: {len(results)} done", nl=False)
+
+        if sys.stdout.isatty():
+            click.echo("")
+        else:
+            click.echo(f"Analyzing URLs: {len(results)} done")
+
+    async def _analyze_url_async(self, client, semaphore, url: str) -> URLAnalysis:
+        """Analyze single URL over the shared async client"""
+        async with semaphore:
+            start_ns = time.perf_counter_ns()
+
+            try:
+                async with client.stream("GET", url, timeout=self.timeout) as response:
+                    html = None
+                    if response.status_code == 200:
+                        buf = bytearray()
+                        async for chunk in response.aiter_bytes(8192):
+                            buf.extend(chunk)
+                            if len(buf) >= self.max_html_bytes or b"</html>" in chunk:
+                                break
+                        html = bytes(buf)
+
+                    response_time = (time.perf_counter_ns() - start_ns) / 1e9
+                    analysis = URLAnalysis(url=url, status_code=response.status_code, response_time=response_time)
+
+                    if html is not None:
+                        self._analyze_content(html, analysis, response.encoding or "utf-8")
+                    else:
+                        analysis.errors.append(f"HTTP {response.status_code}")
+
+                    return analysis
+
+            except httpx.HTTPError as e:
+                response_time = (time.perf_counter_ns() - start_ns) / 1e9
+                return URLAnalysis(
+                    url=url, status_code=0, response_time=response_time, errors=[f"Request error: {str(e)}"]
+                )
+
 
 class ReportGenerator:
     """Report generator"""
 
+    FIELDNAMES = (
+        "URL",
+        "Status Code",
+        "Response Time (s)",
+        "Title",
+        "Title Length",
+        "Meta Description",
+        "Meta Description Length",
+        "H1 Count",
+        "H1 Tags",
+        "Canonical URL",
+        "Robots Meta",
+        "OG Title",
+        "OG Description",
+        "Has Schema Markup",
+        "Errors",
+        "Warnings",
+    )
+
     @staticmethod
     def generate_csv_report(analyses: List[URLAnalysis], filename: str):
         """Generate CSV report"""
-        with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-            fieldnames = [
-                "URL",
-                "Status Code",
-                "Response Time (s)",
-                "Title",
-                "Title Length",
-                "Meta Description",
-                "Meta Description Length",
-                "H1 Count",
-                "H1 Tags",
-                "Canonical URL",
-                "Robots Meta",
-                "OG Title",
-                "OG Description",
-                "Has Schema Markup",
-                "Errors",
-                "Warnings",
-            ]
-
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for analysis in analyses:
-                writer.writerow(
-                    {
-                        "URL": analysis.url,
-                        "Status Code": analysis.status_code,
-                        "Response Time (s)": round(analysis.response_time, 2),
-                        "Title": analysis.title or "",
-                        "Title Length": len(analysis.title) if analysis.title else 0,
-                        "Meta Description": analysis.meta_description or "",
-                        "Meta Description Length": len(analysis.meta_description) if analysis.meta_description else 0,
-                        "H1 Count": len(analysis.h1_tags),
-                        "H1 Tags": "; ".join(analysis.h1_tags),
-                        "Canonical URL": analysis.canonical_url or "",
-                        "Robots Meta": analysis.robots_meta or "",
-                        "OG Title": analysis.og_title or "",
-                        "OG Description": analysis.og_description or "",
-                        "Has Schema Markup": analysis.has_schema_markup,
-                        "Errors": "; ".join(analysis.errors),
-                        "Warnings": "; ".join(analysis.warnings),
-                    }
+        with open(filename, "w", newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(ReportGenerator.FIELDNAMES)
+            writer.writerows(
+                (
+                    analysis.url,
+                    analysis.status_code,
+                    round(analysis.response_time, 2),
+                    analysis.title or "",
+                    len(analysis.title) if analysis.title else 0,
+                    analysis.meta_description or "",
+                    len(analysis.meta_description) if analysis.meta_description else 0,
+                    len(analysis.h1_tags),
+                    "; ".join(analysis.h1_tags),
+                    analysis.canonical_url or "",
+                    analysis.robots_meta or "",
+                    analysis.og_title or "",
+                    analysis.og_description or "",
+                    analysis.has_schema_markup,
+                    "; ".join(analysis.errors),
+                    "; ".join(analysis.warnings),
                 )
+                for analysis in analyses
+            )
 
     @staticmethod
     def generate_summary_report(analyses: List[URLAnalysis]) -> Dict:
         """Generate summary report"""
         total_urls = len(analyses)
-        successful_urls = len([a for a in analyses if a.status_code == 200])
-        error_urls = len([a for a in analyses if a.status_code != 200])
-
-        avg_response_time = sum(a.response_time for a in analyses) / total_urls if total_urls > 0 else 0
-
-        # Count errors and warnings
-        total_errors = sum(len(a.errors) for a in analyses)
-        total_warnings = sum(len(a.warnings) for a in analyses)
-
-        # Most frequent issues
-        all_errors = []
-        all_warnings = []
+        successful_urls = 0
+        error_urls = 0
+        response_time_sum = 0.0
+        total_errors = 0
+        total_warnings = 0
+        error_counts = Counter()
+        warning_counts = Counter()
+
+        # Aggregate everything in one pass over the analyses
         for analysis in analyses:
-            all_errors.extend(analysis.errors)
-            all_warnings.extend(analysis.warnings)
-
-        from collections import Counter
+            if analysis.status_code == 200:
+                successful_urls += 1
+            else:
+                error_urls += 1
+            response_time_sum += analysis.response_time
+            total_errors += len(analysis.errors)
+            total_warnings += len(analysis.warnings)
+            error_counts.update(analysis.errors)
+            warning_counts.update(analysis.warnings)
 
-        common_errors = Counter(all_errors).most_common(5)
-        common_warnings = Counter(all_warnings).most_common(5)
+        avg_response_time = response_time_sum / total_urls if total_urls > 0 else 0
 
         return {
             "total_urls": total_urls,
@@ -465,8 +862,8 @@ class ReportGenerator:
             "avg_response_time": round(avg_response_time, 2),
             "total_errors": total_errors,
             "total_warnings": total_warnings,
-            "common_errors": common_errors,
-            "common_warnings": common_warnings,
+            "common_errors": error_counts.most_common(5),
+            "common_warnings": warning_counts.most_common(5),
         }
 
 
@@ -484,15 +881,24 @@ def cli():
 @click.option("--key-location", required=True, help="URL where API key file is hosted")
 @click.option("--host", help="Site host (if different from sitemap URL)")
 @click.option("--endpoint", default="bing", help="IndexNow endpoint (engine ID, name, or URL)")
-@click.option("--batch-size", default=100, help="URL batch size for submission")
+@click.option("--batch-size", default=10000, help="URL batch size for submission (IndexNow allows up to 10000)")
 @click.option("--delay", default=1, help="Delay between requests (seconds)")
 @click.option("--verbose", "-v", is_flag=True, help="Show all URLs being submitted")
 @click.option("--list-engines", is_flag=True, help="List all available search engines and exit")
-def submit(sitemap_url, api_key, key_location, host, endpoint, batch_size, delay, verbose, list_engines):
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk HTTP cache")
+@click.option(
+    "--dedup",
+    type=click.Choice(["exact", "bloom"]),
+    default="exact",
+    help="URL dedup strategy (bloom saves memory on huge sitemaps)",
+)
+def submit(
+    sitemap_url, api_key, key_location, host, endpoint, batch_size, delay, verbose, list_engines, no_cache, dedup
+):
     """Submit URLs from sitemap to IndexNow"""
 
     # Create submitter to load engines
-    submitter = IndexNowSubmitter(api_key, key_location)
+    submitter = IndexNowSubmitter(api_key, key_location, min_interval=delay, use_cache=not no_cache)
 
     # List engines and exit if requested
     if list_engines:
@@ -530,7 +936,7 @@ def submit(sitemap_url, api_key, key_location, host, endpoint, batch_size, delay
     click.echo(f"Parsing sitemap: {sitemap_url}")
 
     # Parse sitemap
-    parser = SitemapParser()
+    parser = SitemapParser(use_cache=not no_cache, dedup=dedup)
     urls = parser.parse_sitemap(sitemap_url)
 
     click.echo(f"Found {len(urls)} URLs")
@@ -557,37 +963,54 @@ def submit(sitemap_url, api_key, key_location, host, endpoint, batch_size, delay
     click.echo(f"API key: {api_key}")
     click.echo(f"Key location: {key_location}")
 
-    # Submit URLs in batches
+    # Pack each POST up to batch_size URLs while keeping the JSON body
+    # under the ~2MB limit common on IndexNow endpoints; each URL costs
+    # its own length plus quotes and a separator in the serialized list
+    max_batch_bytes = 1_900_000
+    batches = []
+    current, current_bytes = [], 0
+    for url in urls:
+        url_bytes = len(url) + 3
+        if current and (len(current) >= batch_size or current_bytes + url_bytes > max_batch_bytes):
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append(url)
+        current_bytes += url_bytes
+    if current:
+        batches.append(current)
+
+    # Submit batches concurrently; the submitter itself spaces requests
+    # at least `delay` seconds apart across workers
+    total_batches = len(batches)
     total_submitted = 0
     successful_batches = 0
 
-    for i in range(0, len(urls), batch_size):
-        batch = urls[i : i + batch_size]
-
-        click.echo(
-            f"\nSubmitting batch {i // batch_size + 1}/{(len(urls) + batch_size - 1) // batch_size} ({len(batch)} URLs)"
-        )
-
-        if verbose:
-            click.echo("Batch URLs:")
+    if verbose:
+        for idx, batch in enumerate(batches, 1):
+            click.echo(f"\nBatch {idx}/{total_batches} URLs:")
             for url in batch:
                 click.echo(f"  - {url}")
 
-        result = submitter.submit_urls(batch, host, endpoint)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(submitter.submit_urls, batch, host, endpoint): (idx, batch)
+            for idx, batch in enumerate(batches, 1)
+        }
 
-        if result["success"]:
-            successful_batches += 1
-            total_submitted += len(batch)
-            click.echo(f"Successfully submitted {len(batch)} URLs")
-        else:
-            click.echo(f"Submission error: {result['response']}", err=True)
+        for future in as_completed(futures):
+            idx, batch = futures[future]
+            result = future.result()
 
-        if delay > 0 and i + batch_size < len(urls):
-            click.echo(f"Waiting {delay} seconds before next batch...")
-            time.sleep(delay)
+            click.echo(f"\nBatch {idx}/{total_batches} ({len(batch)} URLs) finished")
+            if result["success"]:
+                successful_batches += 1
+                total_submitted += len(batch)
+                click.echo(f"Successfully submitted {len(batch)} URLs")
+            else:
+                click.echo(f"Submission error: {result['response']}", err=True)
 
     click.echo(f"\nTotal submitted: {total_submitted}/{len(urls)} URLs")
-    click.echo(f"Successful batches: {successful_batches}/{(len(urls) + batch_size - 1) // batch_size}")
+    click.echo(f"Successful batches: {successful_batches}/{total_batches}")
 
 
 @cli.command()
@@ -595,24 +1018,29 @@ def submit(sitemap_url, api_key, key_location, host, endpoint, batch_size, delay
 @click.option("--output", default="seo_report", help="Report file prefix")
 @click.option("--max-workers", default=10, help="Number of threads for analysis")
 @click.option("--timeout", default=30, help="HTTP request timeout")
-def analyze(sitemap_url, output, max_workers, timeout):
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk HTTP cache")
+@click.option(
+    "--dedup",
+    type=click.Choice(["exact", "bloom"]),
+    default="exact",
+    help="URL dedup strategy (bloom saves memory on huge sitemaps)",
+)
+def analyze(sitemap_url, output, max_workers, timeout, no_cache, dedup):
     """Analyze SEO for all URLs from sitemap"""
 
     click.echo(f"Parsing sitemap: {sitemap_url}")
 
-    # Parse sitemap
-    parser = SitemapParser(timeout=timeout)
-    urls = parser.parse_sitemap(sitemap_url)
-
-    click.echo(f"Found {len(urls)} URLs for analysis")
+    # Stream URLs out of the sitemap straight into the analyzer so the
+    # first page fetches overlap with nested-sitemap parsing
+    parser = SitemapParser(timeout=timeout, use_cache=not no_cache, dedup=dedup)
+    analyzer = SEOAnalyzer(timeout=timeout, max_workers=max_workers)
+    analyses = analyzer.analyze_urls_batch(parser.iter_sitemap_urls(sitemap_url))
 
-    if not urls:
+    if not analyses:
         click.echo("No URLs found in sitemap", err=True)
         return
 
-    # Analyze URLs
-    analyzer = SEOAnalyzer(timeout=timeout, max_workers=max_workers)
-    analyses = analyzer.analyze_urls_batch(urls)
+    click.echo(f"Analyzed {len(analyses)} URLs")
 
     # Generate reports
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -650,13 +1078,20 @@ def analyze(sitemap_url, output, max_workers, timeout):
 @click.argument("sitemap_url")
 @click.option("--timeout", default=10, help="Accessibility check timeout")
 @click.option("--max-workers", default=20, help="Number of threads")
-def check_availability(sitemap_url, timeout, max_workers):
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk HTTP cache")
+@click.option(
+    "--dedup",
+    type=click.Choice(["exact", "bloom"]),
+    default="exact",
+    help="URL dedup strategy (bloom saves memory on huge sitemaps)",
+)
+def check_availability(sitemap_url, timeout, max_workers, no_cache, dedup):
     """Quick availability check for all URLs from sitemap"""
 
     click.echo(f"Parsing sitemap: {sitemap_url}")
 
     # Parse sitemap
-    parser = SitemapParser(timeout=timeout)
+    parser = SitemapParser(timeout=timeout, use_cache=not no_cache, dedup=dedup)
     urls = parser.parse_sitemap(sitemap_url)
 
     click.echo(f"Checking availability of {len(urls)} URLs")
@@ -665,31 +1100,46 @@ def check_availability(sitemap_url, timeout, max_workers):
         click.echo("No URLs found in sitemap", err=True)
         return
 
-    def check_url(url):
-        try:
-            response = requests.head(url, timeout=timeout, allow_redirects=True)
-            return url, response.status_code, True
-        except requests.RequestException:
-            return url, 0, False
+    async def check_url(client, semaphore, url):
+        async with semaphore:
+            try:
+                # A ranged GET transfers a single byte and, unlike HEAD,
+                # is never rejected with 405 by servers that dislike HEAD.
+                # Stream so servers that ignore Range and reply 200 with a
+                # full body never get it read; leaving the block closes the
+                # connection after the status line
+                async with client.stream(
+                    "GET", url, headers={"Range": "bytes=0-0"}, timeout=timeout, follow_redirects=True
+                ) as response:
+                    return url, response.status_code, True
+            except httpx.HTTPError:
+                return url, 0, False
+
+    async def check_all():
+        semaphore = asyncio.Semaphore(max_workers)
+        limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+        results = []
 
-    available = 0
-    unavailable = 0
-    unavailable_urls = []
+        async with httpx.AsyncClient(http2=True, limits=limits) as client:
+            tasks = [check_url(client, semaphore, url) for url in urls]
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(check_url, url): url for url in urls}
+            with click.progressbar(length=len(urls), label="Checking availability") as bar:
+                for task in asyncio.as_completed(tasks):
+                    results.append(await task)
+                    bar.update(1)
 
-        with click.progressbar(length=len(urls), label="Checking availability") as bar:
-            for future in as_completed(futures):
-                url, status_code, is_available = future.result()
+        return results
 
-                if is_available and status_code == 200:
-                    available += 1
-                else:
-                    unavailable += 1
-                    unavailable_urls.append((url, status_code))
+    available = 0
+    unavailable = 0
+    unavailable_urls = []
 
-                bar.update(1)
+    for url, status_code, is_available in asyncio.run(check_all()):
+        if is_available and status_code in (200, 206):
+            available += 1
+        else:
+            unavailable += 1
+            unavailable_urls.append((url, status_code))
 
     click.echo(f"\nAvailable: {available}")
     click.echo(f"Unavailable: {unavailable}")